@@ -1,10 +1,17 @@
 #!/home/emil/Documents/Repo/Buddy-Terminal/venv/bin/python
 
 import asyncio
+import bisect
 from datetime import datetime, timezone, timedelta
-import traceback
+import functools
 import json
+import logging
+import logging.handlers
+import queue
 import re
+import sys
+import time
+import uuid
 from typing import Optional
 
 from aiohttp import web
@@ -12,6 +19,18 @@ from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable, Static, Input
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
+from textual.reactive import reactive
+from textual.logging import TextualHandler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
 
 
 WEEK_DAYS = [
@@ -46,11 +65,142 @@ DAY_TOKEN_MAP = {
 
 ALL_DAYS = [0, 1, 2, 3, 4, 5, 6]
 
+# QueueHandler still formats each record on the calling thread; only the write
+# is handed to the listener thread, so handlers never block on stdio. There is
+# no active app in that thread, so TextualHandler falls back to printing on
+# sys.stderr, which Textual captures while the app runs.
+log = logging.getLogger("buddy")
+log.setLevel(logging.WARNING)
+_log_queue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, TextualHandler())
+
+# aiohttp copies these into each response, so one shared dict is safe
+_CORS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+}
+_CORS_ORIGIN = {'Access-Control-Allow-Origin': '*'}
+
+_PONG = b"pong"
+
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_KEEPALIVE = b": keepalive\n\n"
+_KEEPALIVE_INTERVAL = 30
+
+# Same compact form orjson emits, so the payload doesn't change shape with the backend
+_JSON_SEPARATORS = (',', ':')
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts, e.g. integers wider than 64 bits
+            return json.dumps(obj, separators=_JSON_SEPARATORS).encode('utf-8')
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=_JSON_SEPARATORS).encode('utf-8')
+
+
+STATUS_INACTIVE = "[blue]⏸ INACTIVE[/blue]"
+STATUS_DONE = "[green]✔ DONE[/green]"
+STATUS_LATE = "[red]⚠ LATE[/red]"
+STATUS_TODO = "[yellow]○ TODO[/yellow]"
+_DIM_TPL = "[dim]%s[/dim]"
+_BAD_DATE_TPL = "[dim]%s (bad date)[/dim]"
+_DONE_TPL = "[strike]%s[/strike]"
+_LATE_TPL = "[bold red]%s[/bold red]"
+
+# (active today, checked, overdue) -> (status, name template, stat counter)
+_ROW_STATES = {
+    (False, False, False): (STATUS_INACTIVE, _DIM_TPL, None),
+    (False, False, True): (STATUS_INACTIVE, _DIM_TPL, None),
+    (False, True, False): (STATUS_INACTIVE, _DIM_TPL, None),
+    (False, True, True): (STATUS_INACTIVE, _DIM_TPL, None),
+    (True, True, False): (STATUS_DONE, _DONE_TPL, "done_count"),
+    (True, True, True): (STATUS_DONE, _DONE_TPL, "done_count"),
+    (True, False, True): (STATUS_LATE, _LATE_TPL, "overdue_count"),
+    (True, False, False): (STATUS_TODO, "%s", "todo_count"),
+}
+
+# Sort keys standing in for the old raw-string order: a missing dueTime ('') sorted
+# before every ISO date and an unparseable one (e.g. "garbage") after them
+_NO_DUE_TS = float('-inf')
+_BAD_DUE_TS = float('inf')
+
+# Above this many moved dueTimes a full re-sort beats reinserting them one by one
+_MAX_REINSERTS = 8
+
+_STAT_TOTAL_TPL = "[#a0a0a0]Total:[/] [#49dfb7][b]%d[/b]"
+_STAT_DONE_TPL = "[#a0a0a0]Done:[/] [#50fa7b][b]%d[/b]"
+_STAT_TODO_TPL = "[#a0a0a0]Todo:[/] [#f1fa8c][b]%d[/b]"
+_STAT_OVERDUE_TPL = "[#a0a0a0]Overdue:[/] [#ff5555][b]%d[/b]"
+
+
+def _task_key(task: dict) -> str:
+    return str(task.get("id"))
+
+
+def _is_task_list(data) -> bool:
+    """POST bodies must be a list of task objects whose dueTime, if set, is a string"""
+    return isinstance(data, list) and all(
+        isinstance(task, dict) and (task.get("dueTime") is None or isinstance(task["dueTime"], str))
+        for task in data
+    )
+
+
+def _ensure_task_ids(tasks: list) -> None:
+    # hash(name) is salted per process and collides on equal names, so give
+    # id-less tasks a stable id once and keep it on the task from then on
+    for task in tasks:
+        if task.get("id") is None:
+            task["id"] = uuid.uuid4().hex
+
+
+# Keyed by the string, so it also catches repeats TaskServer.due_datetime's
+# per-id cache misses, e.g. id-less tasks that come back with fresh ids
+if sys.version_info >= (3, 11):
+    # fromisoformat is C-implemented and accepts a trailing "Z" natively, which
+    # beats any hand-rolled slicing parser
+    @functools.lru_cache(maxsize=2048)
+    def _parse_due_time(value: str) -> datetime:
+        """Parse a dueTime string into an aware datetime, assuming UTC when naive"""
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+else:
+    @functools.lru_cache(maxsize=2048)
+    def _parse_due_time(value: str) -> datetime:
+        """Parse a dueTime string into an aware datetime, assuming UTC when naive"""
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
 
 def _js_day_from_datetime(dt: datetime) -> int:
     return (dt.weekday() + 1) % 7
 
 
+def _clock():
+    """One clock read per refresh: (UTC timestamp, local JS weekday).
+
+    Deliberately not pinned to a tzinfo captured at startup: astimezone()
+    picks the right DST offset for each instant, a cached fixed offset would not.
+    """
+    now = datetime.now(timezone.utc)
+    return now.timestamp(), _js_day_from_datetime(now.astimezone())
+
+
 def _ensure_active_days(task: dict) -> list:
     active_days = task.get("activeDays")
     if not isinstance(active_days, list) or len(active_days) == 0:
@@ -107,9 +257,11 @@ def _parse_active_days_input(text: str) -> Optional[list]:
 class TaskServer:
     def __init__(self, update_callback):
         self.update_callback = update_callback
-        self.current_tasks = []
-        self.sse_clients = []
+        self._due_cache = {}
+        self.set_tasks([])
+        self.sse_clients = set()
         self.last_date_check = None
+        self._next_midnight_epoch = 0.0
         self.app = web.Application()
         self.app.add_routes([
             web.options('/tasks', self.handle_options),
@@ -121,24 +273,29 @@ class TaskServer:
         ])
         self.runner = None
         self.site = None
+        self._sse_wakeups = {}
+        self._sse_transports = {}
+        self._keepalive_task = None
 
     def should_update_dates(self):
         """Check if we should update dates (only once per day)"""
-        now = datetime.now(timezone.utc)
-        today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+        now = time.time()
+        if now < self._next_midnight_epoch:
+            return False
+        self._mark_date_check(now)
+        return True
 
-        if self.last_date_check is None or self.last_date_check < today:
-            self.last_date_check = now
-            return True
-        return False
+    def _mark_date_check(self, now: float):
+        """Record a date check and the next UTC midnight, when the next one is due"""
+        self.last_date_check = datetime.fromtimestamp(now, timezone.utc)
+        self._next_midnight_epoch = now - now % 86400 + 86400
 
     def update_task_dates_to_today(self, tasks):
         """Update task dates to today if they're from a previous day"""
-        if not isinstance(tasks, list):
-            return tasks
-
         now = datetime.now(timezone.utc)
         today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+        today_date = today.date()
+        today_prefix = today_date.isoformat()
 
         changed = False
         for task in tasks:
@@ -148,38 +305,75 @@ class TaskServer:
 
             _ensure_active_days(task)
 
+            # The staleness check below uses the date as written, so an
+            # extended-format YYYY-MM-DD prefix of today or later needs no parse
+            due_date_str = due_time_str[:10]
+            if due_date_str >= today_prefix and due_date_str[4:5] == '-':
+                continue
+
             try:
-                due_time_str = due_time_str.replace('Z', '+00:00')
-                task_due = datetime.fromisoformat(due_time_str)
-                if task_due.tzinfo is None:
-                    task_due = task_due.replace(tzinfo=timezone.utc)
+                task_id = _task_key(task)
+                task_due = self.due_datetime(task_id, due_time_str)
 
-                task_due_date = datetime(task_due.year, task_due.month, task_due.day, tzinfo=timezone.utc)
+                task_due_date = task_due.date()
 
-                if task_due_date < today:
+                if task_due_date < today_date:
                     next_active = self._get_next_active_date(task, today)
-                    new_due_time = datetime(
-                        next_active.year, next_active.month, next_active.day,
-                        task_due.hour, task_due.minute, task_due.second, task_due.microsecond,
-                        tzinfo=timezone.utc
-                    )
-                    task['dueTime'] = new_due_time.isoformat()
+                    # A whole-day shift keeps the wall-clock time; only offset-bearing input needs re-tagging as UTC
+                    new_due_time = task_due + timedelta(days=(next_active.date() - task_due_date).days)
+                    if new_due_time.tzinfo is not timezone.utc:
+                        new_due_time = new_due_time.replace(tzinfo=timezone.utc)
+                    new_due_str = task['dueTime'] = new_due_time.isoformat()
+                    self._due_cache[task_id] = (new_due_str, new_due_time)
                     task['alarmTriggered'] = False
                     task['checked'] = False
                     changed = True
-                    print(
-                        f"✓ [TERMINAL] Updated task '{task.get('name')}' date from {task_due_date.date()} to {today.date()}")
+                    log.info("✓ [TERMINAL] Updated task '%s' date from %s to %s",
+                             task.get('name'), task_due_date, today_date)
 
             except Exception as e:
-                print(f"Error updating date for task {task.get('name')}: {e}")
+                log.warning("Error updating date for task %s: %s", task.get('name'), e)
                 continue
 
         if changed:
             # Reset the date check flag when we've made changes
-            self.last_date_check = now
+            self._mark_date_check(now.timestamp())
 
         return tasks
 
+    def due_datetime(self, task_id, due_str):
+        """Parsed dueTime for a task, reused until that task's dueTime string changes"""
+        hit = self._due_cache.get(task_id)
+        if hit is not None and hit[0] == due_str:
+            return hit[1]
+        parsed = _parse_due_time(due_str)
+        self._due_cache[task_id] = (due_str, parsed)
+        return parsed
+
+    def set_tasks(self, tasks):
+        """Replace the task list, or mark it changed after in-place edits.
+
+        Rebuilds the id index and drops the encoded payload. The JSON is encoded
+        on first use after a change, then shared by every SSE client and GET
+        request, so updates nobody is listening for cost no encoding at all.
+        """
+        self.current_tasks = tasks
+        self.tasks_by_id = {_task_key(task): task for task in tasks}
+        self._due_cache = {key: hit for key, hit in self._due_cache.items() if key in self.tasks_by_id}
+        self._tasks_json = None
+        self._cached_payload = None
+
+    def _payload_json(self) -> bytes:
+        if self._tasks_json is None:
+            self._tasks_json = _json_dumps(self.current_tasks)
+        return self._tasks_json
+
+    def _payload_frame(self) -> bytes:
+        if self._cached_payload is None:
+            # join copies the encoded tasks once; chained + would copy them twice
+            self._cached_payload = b"".join((_SSE_PREFIX, self._payload_json(), _SSE_SUFFIX))
+        return self._cached_payload
+
     def _get_next_active_date(self, task: dict, from_date: datetime) -> datetime:
         active_days = _ensure_active_days(task)
         for offset in range(0, 7):
@@ -190,31 +384,41 @@ class TaskServer:
         return from_date
 
     async def start(self):
-        self.runner = web.AppRunner(self.app)
+        # The extension pings constantly; skip formatting an access log line per request
+        self.runner = web.AppRunner(self.app, access_log=None)
         await self.runner.setup()
-        self.site = web.TCPSite(self.runner, '0.0.0.0', 2137)
+        # Deeper accept queue for bursts of POSTs from the extension. SO_REUSEPORT is
+        # left off: tasks live in this process, so a second instance sharing the
+        # port would silently split POSTs and SSE clients between them.
+        self.site = web.TCPSite(self.runner, '0.0.0.0', 2137, backlog=512)
         await self.site.start()
-        print(f"DEBUG: Server started on port 2137 with SSE support")
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+        log.debug("Server started on port 2137 with SSE support")
 
     async def stop(self):
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+        # Let parked SSE handlers return so cleanup doesn't wait on them
+        for client in tuple(self.sse_clients):
+            self._drop_sse_client(client)
         if self.site:
             await self.site.stop()
         if self.runner:
             await self.runner.cleanup()
-        print(f"DEBUG: Server stopped")
+        log.debug("Server stopped")
 
     async def handle_options(self, request):
-        return web.Response(headers={
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type',
-        })
+        return web.Response(headers=_CORS)
 
     async def handle_ping(self, request):
-        return web.Response(text="pong", headers={'Access-Control-Allow-Origin': '*'})
+        return web.Response(body=_PONG, content_type='text/plain', headers=_CORS_ORIGIN)
 
     async def handle_get_tasks(self, request):
-        return web.json_response(self.current_tasks, headers={'Access-Control-Allow-Origin': '*'})
+        return web.Response(
+            body=self._payload_json(),
+            content_type='application/json',
+            headers=_CORS_ORIGIN,
+        )
 
     async def handle_sse(self, request):
         response = web.StreamResponse(
@@ -225,69 +429,112 @@ class TaskServer:
                 'Cache-Control': 'no-cache',
                 'Access-Control-Allow-Origin': '*',
                 'Connection': 'keep-alive',
+                # Stop nginx-style reverse proxies from buffering the small event frames
+                'X-Accel-Buffering': 'no',
             }
         )
         await response.prepare(request)
 
-        self.sse_clients.append(response)
-        print(f"✓ SSE client connected (total: {len(self.sse_clients)})")
+        wakeup = asyncio.Event()
+        self.sse_clients.add(response)
+        self._sse_wakeups[response] = wakeup
+        self._sse_transports[response] = request.transport
+        log.info("✓ SSE client connected (total: %d)", len(self.sse_clients))
 
         try:
             if self.current_tasks and self.should_update_dates():
-                print("🔄 First SSE connection today - checking if dates need updating...")
-                self.current_tasks = self.update_task_dates_to_today(self.current_tasks)
+                log.info("🔄 First SSE connection today - checking if dates need updating...")
+                self.set_tasks(self.update_task_dates_to_today(self.current_tasks))
 
-            await response.write(f"data: {json.dumps(self.current_tasks)}\n\n".encode('utf-8'))
+            await response.write(self._payload_frame())
 
+            # Keepalives come from the shared ticker. Broadcasts only wake this loop,
+            # and a wakeup always sends the newest frame, so updates that land while
+            # a slow client is still draining collapse into one write.
             while True:
-                await asyncio.sleep(30)
-                try:
-                    await response.write(": keepalive\n\n".encode('utf-8'))
-                except:
+                await wakeup.wait()
+                wakeup.clear()
+                if response not in self.sse_clients:
                     break
+                await response.write(self._payload_frame())
         except Exception as e:
-            print(f"SSE client disconnected: {e}")
+            log.info("SSE client disconnected: %s", e)
         finally:
-            if response in self.sse_clients:
-                self.sse_clients.remove(response)
-            print(f"✓ SSE client removed (remaining: {len(self.sse_clients)})")
+            self._drop_sse_client(response)
+            log.info("✓ SSE client removed (remaining: %d)", len(self.sse_clients))
 
         return response
 
     async def broadcast_tasks(self):
-        """Send updated tasks to all connected browsers via SSE"""
+        """Send updated tasks to all connected browsers via SSE.
+
+        Only wakes each client's writer in handle_sse, so neither a POST nor a
+        terminal action waits on a slow browser.
+        """
         if not self.sse_clients:
             return
 
-        message = f"data: {json.dumps(self.current_tasks)}\n\n".encode('utf-8')
-        disconnected = []
+        for client in self._live_sse_clients():
+            self._sse_wakeups[client].set()
 
-        for client in self.sse_clients:
-            try:
-                await client.write(message)
-            except Exception as e:
-                print(f"Failed to send to SSE client: {e}")
-                disconnected.append(client)
-
-        for client in disconnected:
-            if client in self.sse_clients:
-                self.sse_clients.remove(client)
+    def _live_sse_clients(self):
+        """Snapshot of clients to write to, dropping any whose socket is already closing"""
+        live = []
+        for client in tuple(self.sse_clients):
+            transport = self._sse_transports.get(client)
+            if transport is None or transport.is_closing():
+                self._drop_sse_client(client)
+            else:
+                live.append(client)
+        return live
+
+    def _drop_sse_client(self, client):
+        """Forget a client and release its handle_sse coroutine"""
+        self.sse_clients.discard(client)
+        self._sse_transports.pop(client, None)
+        wakeup = self._sse_wakeups.pop(client, None)
+        if wakeup is not None:
+            wakeup.set()
+
+    async def _keepalive_loop(self):
+        """One ticker for all SSE clients instead of a sleep loop per connection"""
+        while True:
+            await asyncio.sleep(_KEEPALIVE_INTERVAL)
+            if not self.sse_clients:
+                continue
+            clients = self._live_sse_clients()
+            results = await asyncio.gather(
+                *(client.write(_KEEPALIVE) for client in clients),
+                return_exceptions=True,
+            )
+            for client, result in zip(clients, results):
+                if isinstance(result, Exception):
+                    self._drop_sse_client(client)
 
     async def handle_tasks(self, request):
         try:
-            data = await request.json()
+            body = await request.read()
+            try:
+                data = _json_loads(body)
+            except ValueError as e:
+                return web.Response(status=400, text=f"Invalid JSON: {e}", headers=_CORS_ORIGIN)
+
+            # Checked once here so the rest of the app can trust the shape
+            if not _is_task_list(data):
+                return web.Response(status=400, text="Expected a JSON array of task objects", headers=_CORS_ORIGIN)
 
+            _ensure_task_ids(data)
             data = self.update_task_dates_to_today(data)
 
-            self.current_tasks = data
+            self.set_tasks(data)
             self.update_callback(self.current_tasks)
 
             await self.broadcast_tasks()
 
-            return web.Response(text="Received", headers={'Access-Control-Allow-Origin': '*'})
+            return web.Response(text="Received", headers=_CORS_ORIGIN)
         except Exception as e:
-            traceback.print_exc()
-            return web.Response(status=500, text=str(e), headers={'Access-Control-Allow-Origin': '*'})
+            log.exception("Failed to handle posted tasks")
+            return web.Response(status=500, text=str(e), headers=_CORS_ORIGIN)
 
 
 # ==================== MODAL SCREENS ====================
@@ -437,22 +684,25 @@ class AddTaskScreen(ModalScreen):
             yield Static("Tab to switch • Enter to save • Escape to cancel", id="add-help")
 
     def on_mount(self) -> None:
-        self.query_one("#task-name-input", Input).focus()
+        self._name_input = self.query_one("#task-name-input", Input)
+        self._time_input = self.query_one("#task-time-input", Input)
+        self._days_input = self.query_one("#task-days-input", Input)
+        self._name_input.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key - collect both inputs and return"""
-        task_name = self.query_one("#task-name-input", Input).value.strip()
-        task_time = self.query_one("#task-time-input", Input).value.strip()
-        task_days = self.query_one("#task-days-input", Input).value.strip()
+        task_name = self._name_input.value.strip()
+        task_time = self._time_input.value.strip()
+        task_days = self._days_input.value.strip()
 
         if task_name and task_time:
             self.dismiss({"name": task_name, "time": task_time, "days": task_days})
         else:
             # Focus on the empty field
             if not task_name:
-                self.query_one("#task-name-input", Input).focus()
+                self._name_input.focus()
             elif not task_time:
-                self.query_one("#task-time-input", Input).focus()
+                self._time_input.focus()
 
     def key_escape(self) -> None:
         """Handle Escape key"""
@@ -605,6 +855,11 @@ class TaskBuddyApp(App):
     Footer { background: #373636; color: #a0a0a0; }
     """
 
+    total_count = reactive(0, init=False)
+    done_count = reactive(0, init=False)
+    todo_count = reactive(0, init=False)
+    overdue_count = reactive(0, init=False)
+
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("a", "decrease_time", "Time -1min"),
@@ -620,17 +875,38 @@ class TaskBuddyApp(App):
         yield Static("Initializing...", id="status", classes="status-box")
 
         with Horizontal(classes="stats-container"):
-            yield Static("Total: [b]0[/b]", id="stat-total", classes="stat-box")
-            yield Static("Done: [b]0[/b]", id="stat-done", classes="stat-box")
-            yield Static("Todo: [b]0[/b]", id="stat-todo", classes="stat-box")
-            yield Static("Overdue: [b]0[/b]", id="stat-overdue", classes="stat-box")
+            yield Static(_STAT_TOTAL_TPL % 0, id="stat-total", classes="stat-box")
+            yield Static(_STAT_DONE_TPL % 0, id="stat-done", classes="stat-box")
+            yield Static(_STAT_TODO_TPL % 0, id="stat-todo", classes="stat-box")
+            yield Static(_STAT_OVERDUE_TPL % 0, id="stat-overdue", classes="stat-box")
 
         yield DataTable()
         yield Footer()
 
     async def on_mount(self) -> None:
-        table = self.query_one(DataTable)
-        table.add_columns("Status", "Time", "Days", "Task Name")
+        table = self._table = self.query_one(DataTable)
+        self._column_keys = table.add_columns("Status", "Time", "Days", "Task Name")
+        self._row_cache = {}
+        self._row_buckets = {}
+        self._due_cache = {}
+        self._row_keys = []
+        self._sort_sig = None
+        self._sort_keys = []
+        self._sort_pairs = []
+        self._sort_order = []
+        self._w_status = self.query_one("#status")
+        self._w_total = self.query_one("#stat-total")
+        self._w_done = self.query_one("#stat-done")
+        self._w_todo = self.query_one("#stat-todo")
+        self._w_overdue = self.query_one("#stat-overdue")
+        self._pending_tasks = None
+        self._pending_updates = 0
+        self._refresh_timer = None
+        self._refresh_delay = 0.03
+        self._pending_sync = None
+        self._last_update_ts = None
+        self._last_tick_str = None
+        self.set_interval(1.0, self._tick_status)
         table.cursor_type = "row"
         table.focus()
         table.zebra_stripes = True
@@ -638,7 +914,7 @@ class TaskBuddyApp(App):
         self.server = TaskServer(self.update_tasks)
         await self.server.start()
 
-        self.query_one("#status").update("Server Running on Port 2137 • Waiting for tasks...")
+        self._w_status.update("Server Running on Port 2137 • Waiting for tasks...")
 
     async def on_unmount(self) -> None:
         """Cleanup when the app is closed"""
@@ -646,119 +922,224 @@ class TaskBuddyApp(App):
             await self.server.stop()
 
     def update_tasks(self, tasks):
-        """Callback from server to update UI"""
-        tasks = self.server.update_task_dates_to_today(tasks)
-        self.call_later(self._refresh_table, tasks)
+        """Callback from server to update UI, coalescing bursts into one refresh"""
+        self._pending_tasks = self.server.update_task_dates_to_today(tasks)
+        self._pending_updates += 1
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(self._refresh_delay, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Render the latest task snapshot received during the debounce window"""
+        tasks = self._pending_tasks
+        self._pending_tasks = None
+        self._refresh_timer = None
+
+        # Widen the window while POSTs arrive in bursts, tighten it when they don't
+        self._refresh_delay = 0.06 if self._pending_updates > 1 else 0.015
+        self._pending_updates = 0
+
+        self._refresh_table(tasks)
+
+    def _parse_due(self, task_id, due_str):
+        """Return the cached (local HH:MM, UTC timestamp) for a dueTime, or None if it is invalid"""
+        cache_key = (task_id, due_str)
+        hit = self._due_cache.get(cache_key)
+        if hit is None:
+            try:
+                due_utc = self.server.due_datetime(task_id, due_str)
+            except Exception:
+                return None
+            hit = self._due_cache[cache_key] = (due_utc.astimezone().strftime("%H:%M"), due_utc.timestamp())
+        return hit
+
+    def _render_row(self, task_id, task, now_ts, current_js_day):
+        """Build the table cells for a task and the stat counter it counts towards"""
+        name = task.get('name', 'Unknown task')
+        is_checked = task.get('checked', False)
+        due_str = task.get('dueTime', '')
+        active_days = _ensure_active_days(task)
+        active_today = _is_task_active_on_day(task, current_js_day)
 
-    def _refresh_table(self, tasks):
-        """Refresh the table display"""
-        table = self.query_one(DataTable)
-
-        # Save current row key
-        previous_key = None
-        if table.cursor_row is not None and table.row_count:
-            for idx, key in enumerate(table.rows.keys()):
-                if idx == table.cursor_row:
-                    previous_key = key
-                    break
+        time_str = "??:??"
+        time_passed = False
 
-        table.clear()
+        if due_str:
+            hit = self._parse_due(task_id, due_str)
+            if hit is None:
+                name = _BAD_DATE_TPL % name
+            else:
+                time_str, due_ts = hit
+                time_passed = due_ts < now_ts
 
-        if not isinstance(tasks, list):
-            return
+        status, name_tpl, bucket = _ROW_STATES[(active_today, bool(is_checked), time_passed)]
+        days_str = _format_active_days(active_days)
+        return (status, time_str, days_str, name_tpl % name), bucket
 
-        sorted_tasks = sorted(tasks, key=lambda x: x.get('dueTime', ''))
-        current_utc = datetime.now(timezone.utc)
-        current_local = datetime.now().astimezone()
-        current_js_day = _js_day_from_datetime(current_local)
+    def _sort_ts(self, task_id, due_str):
+        if not due_str:
+            return _NO_DUE_TS
+        hit = self._parse_due(task_id, due_str)
+        return hit[1] if hit is not None else _BAD_DUE_TS
+
+    def _moved_due_times(self, sort_sig):
+        """Indexes whose dueTime alone changed since the last sort, or None to re-sort"""
+        previous = self._sort_sig
+        if previous is None or len(previous) != len(sort_sig):
+            return None
+        moved = [index for index, (old, new) in enumerate(zip(previous, sort_sig)) if old != new]
+        if len(moved) > _MAX_REINSERTS or any(previous[index][0] != sort_sig[index][0] for index in moved):
+            return None
+        return moved
 
-        total_tasks = len(tasks)
-        done_count = todo_count = overdue_count = 0
+    def _refresh_table(self, tasks):
+        """Refresh the table display, touching only the rows and cells that changed"""
+        table = self._table
+
+        previous_key = self._cursor_key()
+
+        # Order only depends on ids and dueTimes, so reuse the last sort while those
+        # are unchanged (toggles, renames, day edits). Otherwise sort on the cached
+        # float timestamps; missing dates go first and bad ones last, as before.
+        entries = [(_task_key(task), task) for task in tasks]
+        sort_sig = tuple((task_id, task.get('dueTime', '')) for task_id, task in entries)
+        if sort_sig != self._sort_sig:
+            moved = self._moved_due_times(sort_sig)
+            if moved is None:
+                sort_keys = self._sort_keys = [self._sort_ts(task_id, due_str) for task_id, due_str in sort_sig]
+                order = sorted(range(len(entries)), key=sort_keys.__getitem__)
+                self._sort_pairs = [(sort_keys[index], index) for index in order]
+            else:
+                # (timestamp, index) pairs keep ties in list order, exactly like the stable sort
+                sort_keys, pairs = self._sort_keys, self._sort_pairs
+                for index in moved:
+                    del pairs[bisect.bisect_left(pairs, (sort_keys[index], index))]
+                    sort_keys[index] = self._sort_ts(*sort_sig[index])
+                    bisect.insort(pairs, (sort_keys[index], index))
+            self._sort_order = [index for _, index in self._sort_pairs]
+            self._sort_sig = sort_sig
+
+        now_ts, current_js_day = _clock()
+
+        new_rows = {}
+        new_buckets = {}
+        for index in self._sort_order:
+            task_id, task = entries[index]
+            new_rows[task_id], new_buckets[task_id] = self._render_row(task_id, task, now_ts, current_js_day)
+
+        # Drop parses for tasks that disappeared or whose dueTime moved on
+        live_due_keys = set(sort_sig)
+        self._due_cache = {key: hit for key, hit in self._due_cache.items() if key in live_due_keys}
+
+        # Rows can only be appended, so surviving rows stay put up to the first one
+        # that is out of order; everything after it is re-appended in sorted order.
+        order = list(new_rows)
+        kept = [key for key in self._row_cache if key in new_rows]
+        stable = 0
+        for current_key, target_key in zip(kept, order):
+            if current_key != target_key:
+                break
+            stable += 1
+
+        # DataTable.add_rows can't take row keys, so batch the repaint instead
+        with self.batch_update():
+            if len(kept) - stable > len(order) // 2:
+                # Most rows moved; one clear is cheaper than many O(n) remove_row calls
+                table.clear()
+                stable = 0
+            else:
+                for key in self._row_cache.keys() - new_rows.keys():
+                    table.remove_row(key)
+                for key in kept[stable:]:
+                    table.remove_row(key)
+                for key in order[:stable]:
+                    old, new = self._row_cache[key], new_rows[key]
+                    if old != new:
+                        for column_key, old_value, new_value in zip(self._column_keys, old, new):
+                            if old_value != new_value:
+                                table.update_cell(key, column_key, new_value)
+            for key in order[stable:]:
+                table.add_row(*new_rows[key], key=key)
+
+        self._row_cache = new_rows
+        self._row_buckets = new_buckets
+        self._row_keys = order
+
+        # Keep the cursor on the same task if it moved
+        if previous_key in new_rows:
+            row = table.get_row_index(previous_key)
+            if row != table.cursor_row:
+                table.move_cursor(row=row)
+
+        # Reactives only repaint a stat box when its count actually changes
+        buckets = list(new_buckets.values())
+        self.total_count = len(tasks)
+        self.done_count = buckets.count("done_count")
+        self.todo_count = buckets.count("todo_count")
+        self.overdue_count = buckets.count("overdue_count")
+        self._update_status_bar()
+
+    def _refresh_row(self, task):
+        """Re-render a single task's row in place and adjust the stat counts"""
+        table = self._table
+        key = _task_key(task)
+        if key not in self._row_cache:
+            self._refresh_table(self.server.current_tasks)
+            return
 
-        for task in sorted_tasks:
-            name = task.get('name', 'Unknown task')
-            is_checked = task.get('checked', False)
-            due_str = task.get('dueTime', '')
-            task_id = task.get("id", str(hash(name)))
-            active_days = _ensure_active_days(task)
-            active_today = _is_task_active_on_day(task, current_js_day)
+        now_ts, current_js_day = _clock()
+        new, bucket = self._render_row(key, task, now_ts, current_js_day)
+        for column_key, old_value, new_value in zip(self._column_keys, self._row_cache[key], new):
+            if old_value != new_value:
+                table.update_cell(key, column_key, new_value)
+        self._row_cache[key] = new
+
+        old_bucket = self._row_buckets[key]
+        if old_bucket != bucket:
+            if old_bucket is not None:
+                setattr(self, old_bucket, getattr(self, old_bucket) - 1)
+            if bucket is not None:
+                setattr(self, bucket, getattr(self, bucket) + 1)
+            self._row_buckets[key] = bucket
+        self._update_status_bar()
+
+    def _update_status_bar(self):
+        """Record the time of the latest update for the next status tick"""
+        self._last_update_ts = time.time()
+
+    def _tick_status(self):
+        """Redraw the status bar once a second, and only when its text changes"""
+        if self._last_update_ts is None:
+            return
+        local_now = time.strftime("%H:%M:%S", time.localtime(self._last_update_ts))
+        if local_now != self._last_tick_str:
+            self._last_tick_str = local_now
+            self._w_status.update(f"Server Active (Port 2137) • Last Update: {local_now}")
 
-            time_str = "??:??"
-            time_passed = False
+    def watch_total_count(self, total: int) -> None:
+        self._w_total.update(_STAT_TOTAL_TPL % total)
 
-            if due_str:
-                try:
-                    due_str = due_str.replace('Z', '+00:00')
-                    due_utc = datetime.fromisoformat(due_str)
-                    if due_utc.tzinfo is None:
-                        due_utc = due_utc.replace(tzinfo=timezone.utc)
-
-                    due_local = due_utc.astimezone()
-                    time_str = due_local.strftime("%H:%M")
-                    time_passed = due_utc < current_utc
-                except Exception:
-                    name = f"[dim]{name} (bad date)[/dim]"
-
-            if not active_today:
-                status = "[blue]⏸ INACTIVE[/blue]"
-                style_name = f"[dim]{name}[/dim]"
-            elif is_checked:
-                status = "[green]✔ DONE[/green]"
-                style_name = f"[strike]{name}[/strike]"
-                done_count += 1
-            elif time_passed:
-                status = "[red]⚠ LATE[/red]"
-                style_name = f"[bold red]{name}[/bold red]"
-                overdue_count += 1
-            else:
-                status = "[yellow]○ TODO[/yellow]"
-                style_name = name
-                todo_count += 1
-
-            days_str = _format_active_days(active_days)
-            table.add_row(status, time_str, days_str, style_name, key=task_id)
-
-        # Restore cursor
-        if previous_key is not None and table.row_count:
-            for idx, key in enumerate(table.rows.keys()):
-                if key == previous_key:
-                    table.move_cursor(row=idx)
-                    break
+    def watch_done_count(self, done: int) -> None:
+        self._w_done.update(_STAT_DONE_TPL % done)
 
-        local_now = datetime.now().strftime("%H:%M:%S")
-        self.query_one("#status").update(f"Server Active (Port 2137) • Last Update: {local_now}")
+    def watch_todo_count(self, todo: int) -> None:
+        self._w_todo.update(_STAT_TODO_TPL % todo)
 
-        self.query_one("#stat-total").update(f"[#a0a0a0]Total:[/] [#49dfb7][b]{total_tasks}[/b]")
-        self.query_one("#stat-done").update(f"[#a0a0a0]Done:[/] [#50fa7b][b]{done_count}[/b]")
-        self.query_one("#stat-todo").update(f"[#a0a0a0]Todo:[/] [#f1fa8c][b]{todo_count}[/b]")
-        self.query_one("#stat-overdue").update(f"[#a0a0a0]Overdue:[/] [#ff5555][b]{overdue_count}[/b]")
+    def watch_overdue_count(self, overdue: int) -> None:
+        self._w_overdue.update(_STAT_OVERDUE_TPL % overdue)
 
     def get_selected_task(self):
         """Get the currently selected task"""
-        table = self.query_one(DataTable)
-        if table.cursor_row is None or table.cursor_row >= table.row_count:
+        key = self._cursor_key()
+        if key is None:
             return None
+        return self.server.tasks_by_id.get(key)
 
-        try:
-            row_key = None
-            for idx, key in enumerate(table.rows.keys()):
-                if idx == table.cursor_row:
-                    row_key = key
-                    break
-
-            if row_key is None:
-                return None
-
-            task_id = str(row_key.value)
-
-            for task in self.server.current_tasks:
-                if str(task.get("id")) == task_id:
-                    return task
-        except Exception as e:
-            print(f"Error getting selected task: {e}")
-            traceback.print_exc()
-
-        return None
+    def _cursor_key(self):
+        """Row key under the cursor, looked up by index in the rendered order"""
+        cursor_row = self._table.cursor_row
+        if cursor_row is None or not 0 <= cursor_row < len(self._row_keys):
+            return None
+        return self._row_keys[cursor_row]
 
     def adjust_task_time(self, minutes_delta: int):
         """Adjust the selected task's time"""
@@ -766,35 +1147,33 @@ class TaskBuddyApp(App):
         if not task:
             return
 
-        table = self.query_one(DataTable)
-        current_row = table.cursor_row
-
         due_str = task.get('dueTime')
         if not due_str:
             return
 
         try:
-            due_str = due_str.replace('Z', '+00:00')
-            due_time = datetime.fromisoformat(due_str)
-            if due_time.tzinfo is None:
-                due_time = due_time.replace(tzinfo=timezone.utc)
+            due_time = self.server.due_datetime(_task_key(task), due_str)
 
             new_due_time = due_time + timedelta(minutes=minutes_delta)
             task['dueTime'] = new_due_time.isoformat()
             task['isPreset'] = False
 
-            print(f"✓ Adjusted '{task['name']}' time by {minutes_delta} min: {new_due_time.strftime('%H:%M')}")
+            log.info("✓ Adjusted '%s' time by %d min: %s", task['name'], minutes_delta, new_due_time.strftime('%H:%M'))
 
-            self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
+            # Held keys repeat faster than a refresh + broadcast is worth; flush at most every 50ms
+            if self._pending_sync is None:
+                self._pending_sync = self.set_timer(0.05, self._commit_pending_sync)
 
-            self._refresh_table(self.server.current_tasks)
-            asyncio.create_task(self.sync_tasks_to_webapp())
+        except Exception as e:
+            log.error("Error adjusting time: %s", e)
 
-            if current_row is not None and current_row < table.row_count:
-                table.move_cursor(row=current_row)
+    def _commit_pending_sync(self):
+        """Refresh and broadcast once for all time adjustments since the last flush"""
+        self._pending_sync = None
+        self.server.set_tasks(self.server.update_task_dates_to_today(self.server.current_tasks))
 
-        except Exception as e:
-            print(f"Error adjusting time: {e}")
+        self._refresh_table(self.server.current_tasks)
+        asyncio.create_task(self.sync_tasks_to_webapp())
 
     def action_decrease_time(self):
         """Decrease selected task time by 1 minute"""
@@ -812,11 +1191,10 @@ class TaskBuddyApp(App):
         """Worker method for editing task"""
         task = self.get_selected_task()
         if not task:
-            print("No task selected")
+            log.info("No task selected")
             return
 
-        table = self.query_one(DataTable)
-        current_row = table.cursor_row
+        table = self._table
         current_name = task.get('name', '')
 
         result = await self.push_screen_wait(EditTaskScreen(current_name))
@@ -824,18 +1202,15 @@ class TaskBuddyApp(App):
         if result and result.strip():
             task['name'] = result.strip()
             task['isPreset'] = False
-            print(f"✓ Updated task name to: '{result.strip()}'")
+            log.info("✓ Updated task name to: '%s'", result.strip())
 
-            self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
+            self.server.set_tasks(self.server.update_task_dates_to_today(self.server.current_tasks))
 
             self._refresh_table(self.server.current_tasks)
             asyncio.create_task(self.sync_tasks_to_webapp())
-
-            if current_row is not None and current_row < table.row_count:
-                table.move_cursor(row=current_row)
             table.focus()
         else:
-            print("Task name update cancelled")
+            log.info("Task name update cancelled")
             table.focus()
 
     def action_add_task(self):
@@ -857,7 +1232,7 @@ class TaskBuddyApp(App):
                     hours, minutes = map(int, task_time.split(':'))
                     active_days = _parse_active_days_input(task_days_raw)
                     if active_days is None:
-                        print("❌ Invalid active days. Use Mon Tue Wed Thu Fri Sat Sun or 0-6.")
+                        log.warning("❌ Invalid active days. Use Mon Tue Wed Thu Fri Sat Sun or 0-6.")
                         return
 
                     # Create due time for TODAY (not a past date)
@@ -868,8 +1243,8 @@ class TaskBuddyApp(App):
                         tzinfo=timezone.utc
                     )
 
-                    # Generate unique ID
-                    task_id = str(int(datetime.now().timestamp() * 1000))
+                    # Generate unique ID (millisecond timestamps collide on scripted bursts)
+                    task_id = uuid.uuid4().hex
 
                     # Create new task
                     new_task = {
@@ -883,29 +1258,27 @@ class TaskBuddyApp(App):
                     }
 
                     self.server.current_tasks.append(new_task)
-                    print(f"✓ Added new task: '{task_name}' at {task_time}")
+                    log.info("✓ Added new task: '%s' at %s", task_name, task_time)
 
-                    self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
+                    self.server.set_tasks(self.server.update_task_dates_to_today(self.server.current_tasks))
 
                     self._refresh_table(self.server.current_tasks)
                     asyncio.create_task(self.sync_tasks_to_webapp())
 
                     # Move cursor to the new task
-                    table = self.query_one(DataTable)
-                    for idx, key in enumerate(table.rows.keys()):
-                        if str(key.value) == task_id:
-                            table.move_cursor(row=idx)
-                            break
+                    table = self._table
+                    if task_id in self._row_cache:
+                        table.move_cursor(row=table.get_row_index(task_id))
                     table.focus()
 
                 except ValueError:
-                    print(f"❌ Invalid time format: {task_time}. Use HH:MM (e.g., 14:30)")
+                    log.warning("❌ Invalid time format: %s. Use HH:MM (e.g., 14:30)", task_time)
                 except Exception as e:
-                    print(f"❌ Error adding task: {e}")
+                    log.error("❌ Error adding task: %s", e)
         else:
-            print("Add task cancelled")
+            log.info("Add task cancelled")
 
-        table = self.query_one(DataTable)
+        table = self._table
         table.focus()
 
     def action_delete_task(self):
@@ -919,11 +1292,10 @@ class TaskBuddyApp(App):
     async def _edit_days_worker(self):
         task = self.get_selected_task()
         if not task:
-            print("No task selected")
+            log.info("No task selected")
             return
 
-        table = self.query_one(DataTable)
-        current_row = table.cursor_row
+        table = self._table
         active_days = _ensure_active_days(task)
 
         result = await self.push_screen_wait(EditDaysScreen(active_days))
@@ -931,31 +1303,28 @@ class TaskBuddyApp(App):
         if result is not None:
             parsed_days = _parse_active_days_input(result)
             if parsed_days is None:
-                print("❌ Invalid active days. Use Mon Tue Wed Thu Fri Sat Sun or 0-6.")
+                log.warning("❌ Invalid active days. Use Mon Tue Wed Thu Fri Sat Sun or 0-6.")
                 table.focus()
                 return
 
             task["activeDays"] = parsed_days
             task["isPreset"] = False
-            print(f"✓ Updated active days for '{task.get('name', '')}'")
+            log.info("✓ Updated active days for '%s'", task.get('name', ''))
 
-            self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
+            self.server.set_tasks(self.server.update_task_dates_to_today(self.server.current_tasks))
 
             self._refresh_table(self.server.current_tasks)
             asyncio.create_task(self.sync_tasks_to_webapp())
-
-            if current_row is not None and current_row < table.row_count:
-                table.move_cursor(row=current_row)
             table.focus()
         else:
-            print("Active days update cancelled")
+            log.info("Active days update cancelled")
             table.focus()
 
     async def _delete_task_worker(self):
         """Worker method for deleting task"""
         task = self.get_selected_task()
         if not task:
-            print("No task selected")
+            log.info("No task selected")
             return
 
         task_name = task.get('name', 'Unknown')
@@ -964,7 +1333,7 @@ class TaskBuddyApp(App):
         confirmed = await self.push_screen_wait(DeleteConfirmScreen(task_name))
 
         if confirmed:
-            table = self.query_one(DataTable)
+            table = self._table
             current_row = table.cursor_row
 
             # Remove task from list
@@ -974,10 +1343,10 @@ class TaskBuddyApp(App):
                 if t.get('id') != task_id
             ]
 
-            print(f"✓ Deleted task: '{task_name}'")
+            log.info("✓ Deleted task: '%s'", task_name)
 
             # ✅ Ensure dates are current before syncing
-            self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
+            self.server.set_tasks(self.server.update_task_dates_to_today(self.server.current_tasks))
 
             self._refresh_table(self.server.current_tasks)
             asyncio.create_task(self.sync_tasks_to_webapp())
@@ -988,68 +1357,64 @@ class TaskBuddyApp(App):
                 table.move_cursor(row=new_row)
             table.focus()
         else:
-            print("Delete cancelled")
-            table = self.query_one(DataTable)
+            log.info("Delete cancelled")
+            table = self._table
             table.focus()
 
     async def sync_tasks_to_webapp(self):
         """Send updated tasks back to the web app"""
         try:
             await self.server.broadcast_tasks()
-            print("✓ Broadcasted to all connected browsers")
+            log.info("✓ Broadcasted to all connected browsers")
         except Exception as e:
-            print(f"Broadcast failed: {e}")
+            log.error("Broadcast failed: %s", e)
 
-    def on_data_table_row_selected(self, event: DataTable.RowSelected):
-        """Handle row selection (Enter key on row)"""
-        table = self.query_one(DataTable)
-        current_row = event.cursor_row
-        task_id = str(event.row_key.value)
+    def _toggle_task(self, task_id: str):
+        """Flip a task between DONE and TODO and sync the change"""
+        task = self.server.tasks_by_id.get(task_id)
+        if task is None:
+            return
 
-        for task in self.server.current_tasks:
-            if str(task.get("id")) == task_id:
-                task["checked"] = not task.get("checked", False)
-                if task["checked"]:
-                    task["alarmTriggered"] = False
-                print(f"✓ TOGGLED: {task['name']} → {'DONE' if task['checked'] else 'TODO'}")
+        task["checked"] = not task.get("checked", False)
+        if task["checked"]:
+            task["alarmTriggered"] = False
+        log.info("✓ TOGGLED: %s → %s", task['name'], 'DONE' if task['checked'] else 'TODO')
 
-                # ✅ Ensure dates are current before syncing
-                self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
+        # ✅ Ensure dates are current before syncing
+        last_date_check = self.server.last_date_check
+        self.server.set_tasks(self.server.update_task_dates_to_today(self.server.current_tasks))
 
-                self._refresh_table(self.server.current_tasks)
-                asyncio.create_task(self.sync_tasks_to_webapp())
+        # Only the toggled row changed unless the daily rollover touched other tasks
+        if self.server.last_date_check is last_date_check:
+            self._refresh_row(task)
+        else:
+            self._refresh_table(self.server.current_tasks)
+        asyncio.create_task(self.sync_tasks_to_webapp())
 
-                if current_row < table.row_count:
-                    table.move_cursor(row=current_row)
-                return
+    def on_data_table_row_selected(self, event: DataTable.RowSelected):
+        """Handle row selection (Enter key on row)"""
+        self._toggle_task(str(event.row_key.value))
 
     def on_data_table_cell_selected(self, event: DataTable.CellSelected):
         """Handle cell selection (clicking on cell)"""
         if event.cell_key.row_key is None:
             return
 
-        table = self.query_one(DataTable)
-        current_row = event.coordinate.row
-        task_id = str(event.cell_key.row_key.value)
-
-        for task in self.server.current_tasks:
-            if str(task.get("id")) == task_id:
-                task["checked"] = not task.get("checked", False)
-                if task["checked"]:
-                    task["alarmTriggered"] = False
-                print(f"✓ TOGGLED: {task['name']} → {'DONE' if task['checked'] else 'TODO'}")
-
-                # ✅ Ensure dates are current before syncing
-                self.server.current_tasks = self.server.update_task_dates_to_today(self.server.current_tasks)
-
-                self._refresh_table(self.server.current_tasks)
-                asyncio.create_task(self.sync_tasks_to_webapp())
-
-                if current_row < table.row_count:
-                    table.move_cursor(row=current_row)
-                return
+        self._toggle_task(str(event.cell_key.row_key.value))
 
 
 if __name__ == "__main__":
-    app = TaskBuddyApp()
-    app.run()
+    _log_listener.start()
+    try:
+        app = TaskBuddyApp()
+        if uvloop is not None:
+            # Textual and the aiohttp server share this loop; App.run leaves it open
+            loop = uvloop.new_event_loop()
+            try:
+                app.run(loop=loop)
+            finally:
+                loop.close()
+        else:
+            app.run()
+    finally:
+        _log_listener.stop()